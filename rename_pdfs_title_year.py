@@ -1,30 +1,95 @@
 import argparse
+import ctypes
+import difflib
+import errno
+import functools
+import hashlib
+import importlib
+import json
+import mmap
+import multiprocessing
+import os
 import queue
 import re
+import shutil
+import string
+import subprocess
+import sys
 import threading
 import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Dict, List, Callable
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, List, Callable, Iterable, Iterator
 
-import requests
-from pypdf import PdfReader
+if TYPE_CHECKING:
+    import asyncio
 
-try:
-    import tkinter as tk
-    from tkinter import ttk, filedialog, messagebox
-except Exception:  # GUI optional for CLI usage
-    tk = None
-    ttk = None
-    filedialog = None
-    messagebox = None
-
-INVALID_CHARS = r'<>:"/\\|?*'
-DOI_RE = re.compile(r"(10\.\d{4,9}/[-._;()/:A-Z0-9]+)", re.IGNORECASE)
-YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+    import requests
 
+# heavy optional modules are bound on first use by load_pdf_libs() / load_tk()
+fitz = None
+PdfReader = None
+tk = None
+ttk = None
+filedialog = None
+messagebox = None
 
-@dataclass
+INVALID_CHARS = r'<>:"/\\|?*'
+_INVALID_TABLE = str.maketrans(
+    {ch: "_" for ch in INVALID_CHARS} | {chr(c): None for c in [*range(0x20), 0x7F]}
+)
+_WS_RE = re.compile(r"\s+")
+_PUNCT_TABLE = str.maketrans(
+    {ch: " " for ch in string.punctuation + "“”‘’–—…·"} | {chr(c): None for c in range(0x300, 0x370)}
+)
+DOI_SUFFIX = r"[-._;()/:A-Z0-9]*[-_(/:A-Z0-9]"  # greedy, but never ends on trailing . , ; )
+DOI_PATTERN = rf"(10\.\d{{4,9}}/{DOI_SUFFIX})"
+YEAR_DIGITS = r"(19\d{2}|20\d{2})"
+YEAR_PATTERN = rf"\b{YEAR_DIGITS}\b"
+DOI_RE = re.compile(DOI_PATTERN, re.IGNORECASE)
+YEAR_RE = re.compile(YEAR_PATTERN)
+FILENAME_DOI_RE = re.compile(rf"(10\.\d{{4,9}})(?:/|_|%2F)({DOI_SUFFIX})", re.IGNORECASE)
+ALREADY_NAMED_RE = {
+    "prefix": re.compile(rf"^{YEAR_DIGITS} - .{{8,}}"),
+    "suffix": re.compile(rf"^.{{8,}} \({YEAR_DIGITS}\)$"),
+}
+_PDF_DATE_RE = re.compile(rf"(?:D:)?{YEAR_DIGITS}")
+DOI_YEAR_RE = re.compile(f"{DOI_PATTERN}|{YEAR_PATTERN}", re.IGNORECASE)
+DOI_PREFIX_PATTERN = rb"10\.\d{4,9}/"
+_DOI_PREFIX_RE = re.compile(DOI_PREFIX_PATTERN.decode())
+HYPERSCAN_MIN_TEXT = 64 * 1024  # a page costs a few µs either way; hyperscan pays off on whole-document text
+CROSSREF_API = "https://api.crossref.org"
+CROSSREF_BATCH_SIZE = 40
+CROSSREF_SELECT = "DOI,title,issued,published-print,published-online,created"
+CROSSREF_WORKERS = 16
+CROSSREF_ASYNC_MIN = 8
+CROSSREF_TITLE_ROWS = 3
+CROSSREF_TITLE_WORKERS = 8
+CROSSREF_CACHE_TTL = 30 * 24 * 3600
+TITLE_MATCH_RATIO = 0.9
+GUI_ITEM_BATCH = 16
+PDFTOTEXT_TIMEOUT = 30
+DOC_POOL_SIZE = 64
+MAX_PROCESS_WORKERS = 61
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+RENAME_ATTEMPTS = 100
+
+PROJECT_URL = "https://github.com/kuan0205/Paper-Renamer"
+
+CACHE_DIR = Path.home() / ".cache" / "paper-renamer"
+CACHE_VERSION = 8
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class PreviewItem:
     pdf: Path
     old_name: str
@@ -37,11 +102,138 @@ class PreviewItem:
     apply: bool = False
 
 
+class _RateLimiter:
+    def __init__(self, rate: float, per: float = 1.0, max_interval: float = 10.0, half_life: float = 10.0):
+        self.interval = per / rate
+        self.max_interval = max_interval
+        self.min_interval = 0.0
+        self.half_life = half_life
+        self._backoff = 1.0
+        self._backoff_at = 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def _backoff_factor(self, now: float) -> float:
+        # 429 backoff on top of the header-derived interval, halving every half_life seconds
+        if self._backoff <= 1.0:
+            return 1.0
+        return 1.0 + (self._backoff - 1.0) * 0.5 ** ((now - self._backoff_at) / self.half_life)
+
+    def _step(self, now: float) -> float:
+        step = min(self.interval * self._backoff_factor(now), self.max_interval)
+        return max(step, self.min_interval)
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._step(now)
+        return start - now
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def concurrency(self, cap: int) -> int:
+        with self._lock:
+            return max(1, min(cap, int(round(1.0 / self._step(time.monotonic())))))
+
+    def update(self, headers, status: Optional[int] = None) -> None:
+        limit = headers.get("X-Rate-Limit-Limit")
+        interval = headers.get("X-Rate-Limit-Interval")
+        retry_after = headers.get("Retry-After")
+        with self._lock:
+            now = time.monotonic()
+            try:
+                if limit and interval:
+                    per = float(str(interval).strip().rstrip("s"))
+                    self.interval = per / max(1, int(limit))
+            except ValueError:
+                pass
+            try:
+                if retry_after:
+                    self._next = max(self._next, now + float(retry_after))
+            except ValueError:
+                pass
+            if status == 429:
+                self._backoff = min(self._backoff_factor(now) * 2, self.max_interval / self.interval)
+                self._backoff_at = now
+
+
+_CROSSREF_LIMITER = _RateLimiter(rate=45, per=1.0)
+_TEXT_FLAGS = 0
+_PDF_LIBS_LOCK = threading.Lock()
+# PyMuPDF is not thread-safe: in thread mode all MuPDF calls take turns, pdftotext still runs in parallel
+_MUPDF_LOCK = threading.RLock()
+_PDF_LIBS_LOADED = False
+_HS_LOCAL = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def optional_import(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def load_pdf_libs() -> None:
+    global fitz, PdfReader, _TEXT_FLAGS, _PDF_LIBS_LOADED
+    with _PDF_LIBS_LOCK:
+        if _PDF_LIBS_LOADED:
+            return
+        try:
+            import pymupdf as fitz
+        except ImportError:
+            try:
+                import fitz
+            except ImportError:  # PyMuPDF optional, fall back to pypdf
+                fitz = None
+        try:
+            from pypdf import PdfReader
+        except ImportError:  # only needed when PyMuPDF is missing or fails on a file
+            PdfReader = None
+        if fitz is None and PdfReader is None:
+            raise ImportError("PyMuPDF or pypdf is required: pip install pymupdf")
+        if fitz is not None:
+            # no TEXT_PRESERVE_IMAGES (title/DOI need text only) and no TEXT_DEHYPHENATE (it eats hyphens in DOIs)
+            _TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+        _PDF_LIBS_LOADED = True
+
+
+def load_tk() -> bool:
+    global tk, ttk, filedialog, messagebox
+    try:
+        import tkinter as tk
+        from tkinter import ttk, filedialog, messagebox
+    except Exception:  # GUI optional for CLI usage
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def has_pdftotext() -> bool:
+    return shutil.which("pdftotext") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def doi_prefilter():
+    hyperscan = optional_import("hyperscan")
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(expressions=[DOI_PREFIX_PATTERN], ids=[0], flags=[hyperscan.HS_FLAG_SINGLEMATCH])
+        return db
+    except Exception:
+        return None
+
+
 def sanitize_filename(name: str) -> str:
-    name = re.sub(r"\s+", " ", name).strip()
-    name = name.translate(str.maketrans({ch: "_" for ch in INVALID_CHARS}))
+    name = _WS_RE.sub(" ", name).strip()
+    name = name.translate(_INVALID_TABLE)
     name = name.rstrip(". ").strip()
-    name = name.replace("\u0000", "").strip()
     return name or "untitled"
 
 
@@ -54,90 +246,442 @@ def clamp_filename(stem: str, suffix: str, max_len: int) -> str:
 
 
 def unique_path(path: Path) -> Path:
-    if not path.exists():
+    if not os.path.lexists(path):
         return path
     stem, suffix = path.stem, path.suffix
     i = 2
     while True:
         p = path.with_name(f"{stem} ({i}){suffix}")
-        if not p.exists():
+        if not os.path.lexists(p):
             return p
         i += 1
 
 
-def unique_path_with_reserved(path: Path, reserved: set) -> Path:
+def unique_path_with_reserved(
+    path: Path, reserved: set, next_idx: Optional[Dict[Tuple[str, str], int]] = None
+) -> Path:
     if path.name not in reserved:
         reserved.add(path.name)
         return path
     stem, suffix = path.stem, path.suffix
-    i = 2
+    i = next_idx.get((stem, suffix), 2) if next_idx is not None else 2
     while True:
         name = f"{stem} ({i}){suffix}"
         if name not in reserved:
             reserved.add(name)
+            if next_idx is not None:
+                next_idx[(stem, suffix)] = i + 1
             return path.with_name(name)
         i += 1
 
 
-def extract_title_from_metadata(pdf_path: Path) -> Optional[str]:
+# tool names and dates carry version numbers or timestamps, not the paper's year
+METADATA_SKIP_KEYS = {"format", "creator", "producer", "creationdate", "moddate", "trapped", "encryption"}
+BAD_TITLE_MARKERS = ["microsoft word", "untitled", "doi", "title"]
+
+
+def _cache_file(namespace: str, key: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.json"
+
+
+def cache_load(namespace: str, key: str):
     try:
-        reader = PdfReader(str(pdf_path))
-        md = reader.metadata
-        if md and md.title:
-            t = str(md.title).strip()
-            bad = ["microsoft word", "untitled", "doi", "title"]
-            if len(t) >= 8 and not any(b in t.lower() for b in bad):
-                return t
+        with open(_cache_file(namespace, key), "r", encoding="utf-8") as f:
+            return json.load(f)
     except Exception:
-        pass
+        return None
+
+
+def cache_store(namespace: str, key: str, value) -> None:
+    path = _cache_file(namespace, key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _pdf_cache_key(pdf_path: Path) -> str:
+    st = pdf_path.stat()
+    path_hash = hashlib.sha1(str(pdf_path.resolve()).encode("utf-8")).hexdigest()
+    return f"{path_hash}_{st.st_mtime_ns}_{st.st_size}"
+
+
+class _Uncached(Exception):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+def _disk_memoize(func):
+    @functools.wraps(func)
+    def wrapper(pdf_path: Path, *args):
+        try:
+            key = f"{CACHE_VERSION}:{func.__name__}:{_pdf_cache_key(pdf_path)}:{args!r}"
+        except OSError:
+            return func(pdf_path, *args)
+        hit = cache_load("pdf", key)
+        if isinstance(hit, list):
+            return tuple(hit)
+        try:
+            result = func(pdf_path, *args)
+        except _Uncached as e:  # transient failure, retry on the next run
+            return e.value
+        cache_store("pdf", key, list(result))
+        return result
+    return wrapper
+
+
+def clean_metadata_title(raw) -> Optional[str]:
+    t = str(raw or "").strip()
+    if len(t) >= 8 and not any(b in t.lower() for b in BAD_TITLE_MARKERS):
+        return t
     return None
 
 
-def extract_text_first_pages(pdf_path: Path, max_pages: int) -> str:
+def open_mupdf(pdf_path: Path):
     try:
-        reader = PdfReader(str(pdf_path))
-        texts = []
-        for i in range(min(max_pages, len(reader.pages))):
-            try:
-                texts.append(reader.pages[i].extract_text() or "")
-            except Exception:
-                pass
-        return "\n".join(texts)
+        with open(pdf_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # empty files or filesystems without mmap
+        return fitz.open(str(pdf_path))
+    view = memoryview(mm)
+    try:
+        doc = fitz.open(stream=view, filetype="pdf")
+    except Exception:
+        view.release()
+        mm.close()
+        raise
+    doc._mmap = (view, mm)
+    return doc
+
+
+def open_pdf(pdf_path: Path):
+    load_pdf_libs()
+    if fitz is not None:
+        try:
+            with _MUPDF_LOCK:
+                return open_mupdf(pdf_path)
+        except Exception:
+            if PdfReader is None:
+                raise
+    return PdfReader(str(pdf_path))
+
+
+def is_mupdf(doc) -> bool:
+    return fitz is not None and isinstance(doc, fitz.Document)
+
+
+def mupdf_guard(doc):
+    return _MUPDF_LOCK if is_mupdf(doc) else nullcontext()
+
+
+def close_pdf(doc) -> None:
+    if is_mupdf(doc):
+        with _MUPDF_LOCK:
+            doc.close()
+        mapped = getattr(doc, "_mmap", None)
+        if mapped:
+            doc.stream = None
+            view, mm = mapped
+            view.release()
+            mm.close()
+
+
+_DOC_POOL: "OrderedDict[Tuple[str, int], object]" = OrderedDict()
+_DOC_POOL_LOCK = threading.Lock()
+
+
+def acquire_pdf(pdf_path: Path):
+    key = (str(pdf_path), pdf_path.stat().st_mtime_ns)
+    with _DOC_POOL_LOCK:
+        doc = _DOC_POOL.pop(key, None)
+    if doc is None:
+        doc = open_pdf(pdf_path)
+    return key, doc
+
+
+def release_pdf(key: Tuple[str, int], doc) -> None:
+    evicted = []
+    with _DOC_POOL_LOCK:
+        if key in _DOC_POOL:
+            evicted.append(doc)
+        else:
+            _DOC_POOL[key] = doc
+            while len(_DOC_POOL) > DOC_POOL_SIZE:
+                evicted.append(_DOC_POOL.popitem(last=False)[1])
+    for d in evicted:
+        close_pdf(d)
+
+
+def close_pdf_pool() -> None:
+    with _DOC_POOL_LOCK:
+        docs = list(_DOC_POOL.values())
+        _DOC_POOL.clear()
+    for d in docs:
+        close_pdf(d)
+
+
+def title_from_doc(doc) -> Optional[str]:
+    try:
+        if is_mupdf(doc):
+            return clean_metadata_title((doc.metadata or {}).get("title"))
+        md = doc.metadata
+        return clean_metadata_title(md.title if md else None)
+    except Exception:
+        return None
+
+
+def metadata_text(doc) -> str:
+    try:
+        md = doc.metadata or {}
+        return " ".join(
+            str(v) for k, v in md.items() if v and str(k).lstrip("/").lower() not in METADATA_SKIP_KEYS
+        )
     except Exception:
         return ""
 
 
-def extract_doi_from_text(text: str) -> Optional[str]:
-    if not text:
+def year_from_doc(doc) -> Optional[int]:
+    try:
+        if is_mupdf(doc):
+            raw = (doc.metadata or {}).get("creationDate")
+        else:
+            md = doc.metadata
+            raw = md.get("/CreationDate") if md else None
+    except Exception:
         return None
-    m = DOI_RE.search(text)
-    if not m:
+    m = _PDF_DATE_RE.match(str(raw or "").strip())
+    return latest_year([int(m.group(1))]) if m else None
+
+
+def page_dict(doc, index: int) -> Optional[dict]:
+    try:
+        return doc.load_page(index).get_text("dict", flags=_TEXT_FLAGS)
+    except Exception:
         return None
-    doi = m.group(1).rstrip(".),;")
-    return doi
 
 
-def extract_year_from_text(text: str) -> Optional[int]:
-    if not text:
+def text_from_page_dict(page: dict) -> str:
+    return "\n".join(
+        "".join(span.get("text", "") for span in line.get("spans", ()))
+        for block in page.get("blocks") or ()
+        for line in block.get("lines", ())
+    )
+
+
+def title_from_layout(page: Optional[dict]) -> Optional[str]:
+    if not page:
+        return None
+    blocks = page.get("blocks") or []
+    best_size = 0.0
+    best_text = None
+    chars_by_size: Dict[float, int] = {}
+    for block in blocks:
+        spans = [
+            (round(span.get("size", 0.0), 1), span.get("text", "").strip())
+            for line in block.get("lines", ())
+            for span in line.get("spans", ())
+        ]
+        spans = [(size, text) for size, text in spans if text]
+        if not spans:
+            continue
+        for size, text in spans:
+            chars_by_size[size] = chars_by_size.get(size, 0) + len(text)
+        size = max(size for size, _ in spans)
+        if size > best_size:
+            best_size = size
+            best_text = " ".join(text for s, text in spans if s >= size - 0.5)
+    if not best_text:
         return None
-    years = [int(y) for y in YEAR_RE.findall(text)]
-    if not years:
+    body_size = max(chars_by_size, key=chars_by_size.get)
+    if best_size <= body_size + 0.5:
         return None
-    from datetime import datetime
-    current_year = datetime.now().year
-    years = [y for y in years if 1800 < y <= current_year + 1]
-    if not years:
+    best_text = _WS_RE.sub(" ", best_text).strip()
+    if len(best_text) < 8 or DOI_RE.search(best_text):
         return None
-    return max(years)
+    return best_text
 
 
-def crossref_lookup(doi: str, timeout: int, user_agent: str) -> Tuple[Optional[str], Optional[int]]:
-    url = f"https://api.crossref.org/works/{doi}"
-    headers = {"User-Agent": user_agent, "Accept": "application/json"}
-    r = requests.get(url, headers=headers, timeout=timeout)
-    if r.status_code != 200:
+def iter_page_texts(doc, max_pages: int, first_page: Optional[dict] = None) -> Iterator[str]:
+    mupdf = is_mupdf(doc)
+    count = doc.page_count if mupdf else len(doc.pages)
+    for i in range(min(max_pages, count)):
+        try:
+            if i == 0 and first_page is not None:
+                text = text_from_page_dict(first_page)
+            elif mupdf:
+                page = doc.load_page(i)
+                text = "\n".join(b[4] for b in page.get_text("blocks", flags=_TEXT_FLAGS))
+                page = None
+            else:
+                text = doc.pages[i].extract_text() or ""
+        except Exception:
+            continue
+        yield text
+
+
+def pdftotext_pages(pdf_path: Path, max_pages: int) -> Optional[List[str]]:
+    if max_pages <= 0 or not has_pdftotext():
+        return None
+    cmd = ["pdftotext", "-f", "1", "-l", str(max_pages), "-q", "-enc", "UTF-8", str(pdf_path), "-"]
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=PDFTOTEXT_TIMEOUT,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode("utf-8", "ignore").split("\f")
+
+
+def latest_year(years: Iterable[int]) -> Optional[int]:
+    max_year = datetime.now().year + 1
+    latest = None
+    for y in years:
+        if 1800 < y <= max_year and (latest is None or y > latest):
+            latest = y
+    return latest
+
+
+def has_doi_candidate(text: str) -> bool:
+    if "10." not in text:
+        return False
+    db = doi_prefilter() if len(text) >= HYPERSCAN_MIN_TEXT else None
+    if db is None:
+        return _DOI_PREFIX_RE.search(text) is not None
+    scratch = getattr(_HS_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = _HS_LOCAL.scratch = optional_import("hyperscan").Scratch(db)
+    hits: List[int] = []
+    try:
+        db.scan(
+            text.encode("utf-8", "ignore"),
+            match_event_handler=lambda *_: hits.append(1),
+            scratch=scratch,
+        )
+    except Exception:
+        return True
+    return bool(hits)
+
+
+def extract_doi_and_year(text: str) -> Tuple[Optional[str], Optional[int]]:
+    if not text:
         return None, None
-    data = r.json().get("message", {})
+    if not has_doi_candidate(text):
+        if "19" not in text and "20" not in text:
+            return None, None
+        return None, latest_year(int(m.group(1)) for m in YEAR_RE.finditer(text))
+    doi = None
+    year = None
+    max_year = datetime.now().year + 1
+    for m in DOI_YEAR_RE.finditer(text):
+        if m.group(1):
+            if doi is None:
+                doi = m.group(1)
+            continue
+        y = int(m.group(2))
+        if 1800 < y <= max_year and (year is None or y > year):
+            year = y
+    return doi, year
+
+
+def scan_texts(texts: Iterable[str], stop_at_doi: bool) -> Tuple[Optional[str], Optional[int]]:
+    # pages that are already in memory (pdftotext) get one prefilter pass over the joined text;
+    # lazily decoded MuPDF pages stay page-by-page so the early exit still saves decoding
+    if isinstance(texts, list) and sum(map(len, texts)) >= HYPERSCAN_MIN_TEXT:
+        if not has_doi_candidate("\f".join(texts)):
+            return None, latest_year(int(m.group(1)) for text in texts for m in YEAR_RE.finditer(text))
+    doi = None
+    year = None
+    for text in texts:
+        page_doi, page_year = extract_doi_and_year(text)
+        doi = doi or page_doi
+        if page_year and (year is None or page_year > year):
+            year = page_year
+        if doi and (year or stop_at_doi):
+            break
+    return doi, year
+
+
+@_disk_memoize
+def extract_pdf_info(
+    pdf_path: Path, max_pages: int, stop_at_doi: bool = False, metadata_only: bool = False
+) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    try:
+        key, doc = acquire_pdf(pdf_path)
+    except ImportError:
+        raise
+    except Exception:
+        raise _Uncached((None, None, None))
+    try:
+        with mupdf_guard(doc):
+            title = title_from_doc(doc)
+            if metadata_only:
+                doi, text_year = extract_doi_and_year(f"{pdf_path.stem} {metadata_text(doc)}")
+                return title, doi, year_from_doc(doc) or text_year
+            if title and title.casefold() != pdf_path.stem.casefold():
+                year = year_from_doc(doc)
+                doi, _ = extract_doi_and_year(metadata_text(doc))
+                if year and (doi or not stop_at_doi):
+                    return title, doi, year
+            first_page = None
+            if not title and is_mupdf(doc) and doc.page_count > 0:
+                # one "dict" decode of page 1 serves both the font-size title guess and the text scan
+                first_page = page_dict(doc, 0)
+                title = title_from_layout(first_page)
+        try:
+            pages = None if first_page is not None else pdftotext_pages(pdf_path, max_pages)
+            if pages is not None:
+                doi, year = scan_texts(pages, stop_at_doi)
+            else:
+                with mupdf_guard(doc):
+                    doi, year = scan_texts(iter_page_texts(doc, max_pages, first_page), stop_at_doi)
+        except Exception:
+            doi, year = None, None
+        return title, doi, year
+    finally:
+        release_pdf(key, doc)
+
+
+def get_session() -> "requests.Session":
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+            _SESSION = requests.Session()
+            _SESSION.mount("https://", adapter)
+            _SESSION.headers.update({"Accept": "application/json"})
+        return _SESSION
+
+
+def build_user_agent(mailto: str = "") -> str:
+    contact = f"{PROJECT_URL}; mailto:{mailto}" if mailto else PROJECT_URL
+    return f"Paper-Renamer/1.0 ({contact})"
+
+
+def parse_crossref_work(data: dict) -> Tuple[Optional[str], Optional[int]]:
     title_list = data.get("title") or []
     title = title_list[0].strip() if title_list else None
     year = None
@@ -152,6 +696,211 @@ def crossref_lookup(doi: str, timeout: int, user_agent: str) -> Tuple[Optional[s
     return title, year
 
 
+def crossref_cache_load(namespace: str, key: str) -> Optional[dict]:
+    hit = cache_load(namespace, key)
+    if not isinstance(hit, dict) or not isinstance(hit.get("message"), dict):
+        return None
+    if time.time() - float(hit.get("fetched") or 0) > CROSSREF_CACHE_TTL:
+        return None
+    return hit["message"]
+
+
+def crossref_cache_store(namespace: str, key: str, message: dict) -> None:
+    cache_store(namespace, key, {"fetched": time.time(), "message": message})
+
+
+def crossref_lookup(doi: str, timeout: int, user_agent: str) -> Optional[dict]:
+    url = f"{CROSSREF_API}/works/{doi}"
+    _CROSSREF_LIMITER.acquire()
+    r = get_session().get(url, headers={"User-Agent": user_agent}, timeout=timeout)
+    _CROSSREF_LIMITER.update(r.headers, r.status_code)
+    if r.status_code != 200:
+        return None
+    return r.json().get("message") or None
+
+
+def _norm(title: str) -> str:
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKD", title).translate(_PUNCT_TABLE).casefold()).strip()
+
+
+def titles_match(norm_a: str, norm_b: str) -> bool:
+    if not norm_a or not norm_b:
+        return False
+    return norm_a == norm_b or difflib.SequenceMatcher(None, norm_a, norm_b).ratio() >= TITLE_MATCH_RATIO
+
+
+def crossref_lookup_title(title: str, timeout: int, user_agent: str) -> Optional[dict]:
+    url = f"{CROSSREF_API}/works"
+    params = {
+        "query.bibliographic": title,
+        "rows": CROSSREF_TITLE_ROWS,
+        "select": CROSSREF_SELECT,
+    }
+    _CROSSREF_LIMITER.acquire()
+    r = get_session().get(url, params=params, headers={"User-Agent": user_agent}, timeout=timeout)
+    _CROSSREF_LIMITER.update(r.headers, r.status_code)
+    if r.status_code != 200:
+        return None
+    return pick_title_match(title, r.json().get("message", {}).get("items") or [])
+
+
+def pick_title_match(title: str, works: List[dict]) -> Optional[dict]:
+    key = _norm(title)
+    for work in works:
+        cf_title, _ = parse_crossref_work(work)
+        if cf_title and titles_match(key, _norm(cf_title)):
+            return work
+    return None
+
+
+def crossref_lookup_titles(
+    titles: List[str], timeout: int, user_agent: str, sleep: float, use_cache: bool = True
+) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    keys = {title: _norm(title) for title in titles}
+    works: Dict[str, Optional[dict]] = {}
+    missing: List[str] = []
+    for title, key in keys.items():
+        if not key or key in works:
+            continue
+        hit = crossref_cache_load("crossref-title", key) if use_cache else None
+        if hit is not None:
+            works[key] = hit
+        else:
+            works[key] = None
+            missing.append(title)
+
+    def lookup_one(title: str) -> Optional[dict]:
+        try:
+            return crossref_lookup_title(title, timeout, user_agent)
+        except Exception:
+            return None
+
+    _CROSSREF_LIMITER.min_interval = max(0.0, sleep)
+    if optional_import("aiohttp") is not None and len(missing) >= CROSSREF_ASYNC_MIN:
+        found = run_crossref_async(crossref_title_async, missing, timeout, user_agent)
+    else:
+        with ThreadPoolExecutor(max_workers=CROSSREF_TITLE_WORKERS) as pool:
+            found = list(pool.map(lookup_one, missing))
+    for title, work in zip(missing, found):
+        works[keys[title]] = work
+        if work and use_cache:
+            crossref_cache_store("crossref-title", keys[title], work)
+    return {t: parse_crossref_work(works[k]) if works.get(k) else (None, None) for t, k in keys.items()}
+
+
+def crossref_lookup_batch(dois: List[str], timeout: int, user_agent: str) -> Dict[str, Optional[dict]]:
+    url = f"{CROSSREF_API}/works"
+    params = {
+        "filter": ",".join(f"doi:{d}" for d in dois),
+        "rows": 1000,
+        "select": CROSSREF_SELECT,
+    }
+    _CROSSREF_LIMITER.acquire()
+    r = get_session().get(url, params=params, headers={"User-Agent": user_agent}, timeout=timeout)
+    _CROSSREF_LIMITER.update(r.headers, r.status_code)
+    r.raise_for_status()
+    found: Dict[str, dict] = {}
+    for work in r.json().get("message", {}).get("items") or []:
+        key = str(work.get("DOI") or "").lower()
+        if key:
+            found[key] = work
+    return {d: found.get(d.lower()) for d in dois}
+
+
+async def _crossref_get_async(
+    session, url: str, params: Optional[dict], sem: "asyncio.Semaphore", timeout: int
+) -> Optional[dict]:
+    import asyncio
+
+    async with sem:
+        await asyncio.sleep(_CROSSREF_LIMITER.reserve())
+        client_timeout = optional_import("aiohttp").ClientTimeout(total=timeout)
+        async with session.get(url, params=params, timeout=client_timeout) as r:
+            _CROSSREF_LIMITER.update(r.headers, r.status)
+            if r.status != 200:
+                return None
+            data = await r.json(content_type=None)
+    return data.get("message") or {}
+
+
+async def crossref_lookup_async(session, doi: str, sem: "asyncio.Semaphore", timeout: int) -> Optional[dict]:
+    return await _crossref_get_async(session, f"{CROSSREF_API}/works/{doi}", None, sem, timeout) or None
+
+
+async def crossref_title_async(session, title: str, sem: "asyncio.Semaphore", timeout: int) -> Optional[dict]:
+    params = {
+        "query.bibliographic": title,
+        "rows": str(CROSSREF_TITLE_ROWS),
+        "select": CROSSREF_SELECT,
+    }
+    message = await _crossref_get_async(session, f"{CROSSREF_API}/works", params, sem, timeout)
+    if message is None:
+        return None
+    return pick_title_match(title, message.get("items") or [])
+
+
+async def _gather_crossref(fetch, keys: List[str], timeout: int, user_agent: str) -> List[Optional[dict]]:
+    import asyncio
+
+    sem = asyncio.Semaphore(_CROSSREF_LIMITER.concurrency(CROSSREF_WORKERS))
+    headers = {"User-Agent": user_agent, "Accept": "application/json"}
+
+    async with optional_import("aiohttp").ClientSession(headers=headers) as session:
+        async def lookup(key: str) -> Optional[dict]:
+            try:
+                return await fetch(session, key, sem, timeout)
+            except Exception:
+                return None
+
+        return await asyncio.gather(*(lookup(k) for k in keys))
+
+
+def run_crossref_async(fetch, keys: List[str], timeout: int, user_agent: str) -> List[Optional[dict]]:
+    import asyncio
+
+    return asyncio.run(_gather_crossref(fetch, keys, timeout, user_agent))
+
+
+def crossref_lookup_many(
+    dois: List[str], timeout: int, user_agent: str, sleep: float, use_cache: bool = True
+) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+    works: Dict[str, Optional[dict]] = {}
+    missing: List[str] = []
+    for doi in dois:
+        hit = crossref_cache_load("crossref", doi.lower()) if use_cache else None
+        if hit is not None:
+            works[doi] = hit
+        else:
+            missing.append(doi)
+
+    def lookup_one(doi: str) -> Optional[dict]:
+        try:
+            return crossref_lookup(doi, timeout, user_agent)
+        except Exception:
+            return None
+
+    _CROSSREF_LIMITER.min_interval = max(0.0, sleep)
+    chunks = [missing[i:i + CROSSREF_BATCH_SIZE] for i in range(0, len(missing), CROSSREF_BATCH_SIZE)]
+    failed: List[str] = []
+    with ThreadPoolExecutor(max_workers=CROSSREF_WORKERS) as pool:
+        futures = [pool.submit(crossref_lookup_batch, chunk, timeout, user_agent) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                works.update(future.result())
+            except Exception:
+                failed.extend(chunk)
+        if optional_import("aiohttp") is not None and len(failed) >= CROSSREF_ASYNC_MIN:
+            found = run_crossref_async(crossref_lookup_async, failed, timeout, user_agent)
+        else:
+            found = list(pool.map(lookup_one, failed))
+        works.update(zip(failed, found))
+
+    for doi in missing:
+        if works[doi] and use_cache:
+            crossref_cache_store("crossref", doi.lower(), works[doi])
+    return {d: parse_crossref_work(w) if w else (None, None) for d, w in works.items()}
+
+
 def build_new_stem(title: str, year: Optional[int], style: str) -> str:
     title = sanitize_filename(title)
     if year:
@@ -161,9 +910,34 @@ def build_new_stem(title: str, year: Optional[int], style: str) -> str:
     return title
 
 
+def doi_from_filename(pdf: Path) -> Optional[str]:
+    m = FILENAME_DOI_RE.search(pdf.stem)
+    if not m:
+        return None
+    return f"{m.group(1)}/{m.group(2)}"
+
+
+def looks_already_named(stem: str, style: str) -> bool:
+    return bool(ALREADY_NAMED_RE[style].match(stem))
+
+
+def iter_pdfs(folder: Path, recursive: bool) -> Iterator[Path]:
+    stack = [str(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(e.path)
+                    elif e.name.lower().endswith(".pdf"):
+                        yield Path(e.path)
+        except OSError:
+            continue
+
+
 def collect_pdfs(folder: Path, recursive: bool) -> List[Path]:
-    pattern = "**/*.pdf" if recursive else "*.pdf"
-    return sorted(folder.glob(pattern))
+    return sorted(iter_pdfs(folder, recursive))
 
 
 def compute_preview(
@@ -180,100 +954,132 @@ def compute_preview(
     progress_cb: Optional[Callable[[int, int, Path], None]] = None,
     item_cb: Optional[Callable[[int, int, "PreviewItem"], None]] = None,
     cancel_event: Optional[threading.Event] = None,
+    workers: Optional[int] = None,
+    processes: bool = False,
+    skip_named: bool = False,
+    no_text: bool = False,
+    use_cache: bool = True,
 ) -> List[PreviewItem]:
     cache: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
+    title_cache: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
     reserved_by_dir: Dict[Path, set] = {}
+    next_idx_by_dir: Dict[Path, Dict[Tuple[str, str], int]] = {}
 
     def get_reserved(dir_path: Path) -> set:
         if dir_path not in reserved_by_dir:
             try:
-                reserved_by_dir[dir_path] = {p.name for p in dir_path.iterdir() if p.is_file()}
+                with os.scandir(dir_path) as it:
+                    reserved_by_dir[dir_path] = {e.name for e in it if e.is_file()}
             except Exception:
                 reserved_by_dir[dir_path] = set()
         return reserved_by_dir[dir_path]
 
-    unmatched_root = folder / unmatched_dir if unmatched_dir else None
-    items: List[PreviewItem] = []
-
-    total = len(pdfs)
-    for idx, pdf in enumerate(pdfs, 1):
-        if cancel_event and cancel_event.is_set():
-            break
-        if progress_cb:
-            progress_cb(idx, total, pdf)
-        old_name = pdf.name
-        title = extract_title_from_metadata(pdf)
-        text = extract_text_first_pages(pdf, pages)
-        doi = extract_doi_from_text(text)
-        year_guess = extract_year_from_text(text)
-
-        year = None
-        if doi and not no_crossref:
-            if doi in cache:
-                cf_title, cf_year = cache[doi]
-            else:
-                try:
-                    cf_title, cf_year = crossref_lookup(doi, timeout, user_agent)
-                except Exception:
-                    cf_title, cf_year = None, None
-                cache[doi] = (cf_title, cf_year)
-                time.sleep(max(0.0, sleep))
-            if cf_title:
-                title = cf_title
-            if cf_year:
-                year = cf_year
-
-        if not year and year_guess:
-            year = year_guess
-
-        if not title:
+    def place_item(item: PreviewItem) -> None:
+        pdf = item.pdf
+        if not item.title:
+            item.reason = "no title found"
             if unmatched_root:
                 reserved = get_reserved(unmatched_root)
-                dest = unique_path_with_reserved(unmatched_root / pdf.name, reserved)
-                item = PreviewItem(
-                    pdf=pdf,
-                    old_name=old_name,
-                    new_path=dest,
-                    doi=doi,
-                    title=None,
-                    year=year,
-                    status="move",
-                    reason="no title found",
-                    apply=True,
-                )
-                items.append(item)
-                if item_cb:
-                    item_cb(idx, total, item)
+                next_idx = next_idx_by_dir.setdefault(unmatched_root, {})
+                item.new_path = unique_path_with_reserved(unmatched_root / pdf.name, reserved, next_idx)
+                item.status = "move"
+                item.apply = True
             else:
-                item = PreviewItem(
-                    pdf=pdf,
-                    old_name=old_name,
-                    new_path=None,
-                    doi=doi,
-                    title=None,
-                    year=year,
-                    status="skip",
-                    reason="no title found",
-                    apply=False,
-                )
-                items.append(item)
-                if item_cb:
-                    item_cb(idx, total, item)
-            continue
+                item.status = "skip"
+            return
 
-        new_stem = build_new_stem(title, year, style)
+        new_stem = build_new_stem(item.title, item.year, style)
         new_name = clamp_filename(new_stem, ".pdf", maxlen)
         reserved = get_reserved(pdf.parent)
-        new_path = unique_path_with_reserved(pdf.with_name(new_name), reserved)
+        reserved.discard(pdf.name)  # the file's own name is free for itself
+        next_idx = next_idx_by_dir.setdefault(pdf.parent, {})
+        item.new_path = unique_path_with_reserved(pdf.with_name(new_name), reserved, next_idx)
 
-        if new_path.name == old_name:
+        if item.new_path.name == item.old_name:
+            item.status = "ok"
+            item.reason = "already good name"
+        else:
+            item.status = "rename"
+            item.reason = "ready"
+            item.apply = True
+
+    unmatched_root = folder / unmatched_dir if unmatched_dir else None
+    items: List[PreviewItem] = []
+    titles: List[Optional[str]] = []
+    dois: List[Optional[str]] = []
+    year_guesses: List[Optional[int]] = []
+    named = [skip_named and looks_already_named(pdf.stem, style) for pdf in pdfs]
+    name_dois = [None if no_crossref else doi_from_filename(pdf) for pdf in pdfs]
+
+    total = len(pdfs)
+    workers = max(1, workers or os.cpu_count() or 1)
+    if processes:
+        pool = ProcessPoolExecutor(max_workers=min(workers, MAX_PROCESS_WORKERS))
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        with pool:
+            futures = [
+                None if skip or name_doi else pool.submit(extract_pdf_info, pdf, pages, not no_crossref, no_text)
+                for pdf, skip, name_doi in zip(pdfs, named, name_dois)
+            ]
+            for idx, (pdf, future) in enumerate(zip(pdfs, futures), 1):
+                if cancel_event and cancel_event.is_set():
+                    for f in futures:
+                        if f:
+                            f.cancel()
+                    break
+                if progress_cb:
+                    progress_cb(idx, total, pdf)
+                title, doi, year_guess = future.result() if future else (None, name_dois[idx - 1], None)
+                titles.append(title)
+                dois.append(doi)
+                year_guesses.append(year_guess)
+
+            if not no_crossref and not (cancel_event and cancel_event.is_set()):
+                pending_dois = list(dict.fromkeys(dois[i] for i in range(len(dois)) if dois[i] and not named[i]))
+                cache.update(crossref_lookup_many(pending_dois, timeout, user_agent, sleep, use_cache))
+                # filename DOIs Crossref doesn't know: read the PDF after all and use the DOI found in its text
+                retry_futures = {
+                    i: pool.submit(extract_pdf_info, pdfs[i], pages, True, no_text)
+                    for i in range(len(dois))
+                    if name_dois[i] and not named[i] and not cache.get(name_dois[i], (None, None))[0]
+                }
+                retry_dois: List[str] = []
+                for i, future in retry_futures.items():
+                    if cancel_event and cancel_event.is_set():
+                        for f in retry_futures.values():
+                            f.cancel()
+                        break
+                    titles[i], dois[i], year_guesses[i] = future.result()
+                    if dois[i] and dois[i] not in cache:
+                        retry_dois.append(dois[i])
+                if retry_dois and not (cancel_event and cancel_event.is_set()):
+                    retry_dois = list(dict.fromkeys(retry_dois))
+                    cache.update(crossref_lookup_many(retry_dois, timeout, user_agent, sleep, use_cache))
+                pending_titles = list(dict.fromkeys(
+                    titles[i] for i in range(len(titles)) if titles[i] and not dois[i] and not named[i]
+                ))
+                if not (cancel_event and cancel_event.is_set()):
+                    title_cache.update(crossref_lookup_titles(pending_titles, timeout, user_agent, sleep, use_cache))
+    finally:
+        # pooled documents only serve this preview; keep no files open (and locked on Windows) after it
+        close_pdf_pool()
+
+    if cancel_event and cancel_event.is_set():
+        return items  # half-resolved rows must never reach the caller as renames or moves
+
+    for i in range(len(titles)):
+        pdf, title, doi, year_guess = pdfs[i], titles[i], dois[i], year_guesses[i]
+        idx = i + 1
+        if named[i]:
             item = PreviewItem(
                 pdf=pdf,
-                old_name=old_name,
-                new_path=new_path,
-                doi=doi,
-                title=title,
-                year=year,
+                old_name=pdf.name,
+                new_path=pdf,
+                doi=None,
+                title=None,
+                year=None,
                 status="ok",
                 reason="already good name",
                 apply=False,
@@ -281,25 +1087,72 @@ def compute_preview(
             items.append(item)
             if item_cb:
                 item_cb(idx, total, item)
-        else:
-            item = PreviewItem(
-                pdf=pdf,
-                old_name=old_name,
-                new_path=new_path,
-                doi=doi,
-                title=title,
-                year=year,
-                status="rename",
-                reason="ready",
-                apply=True,
-            )
-            items.append(item)
-            if item_cb:
-                item_cb(idx, total, item)
+            continue
+
+        year = None
+        if doi in cache:
+            cf_title, cf_year = cache[doi]
+            if cf_title:
+                title = cf_title
+            if cf_year:
+                year = cf_year
+        elif not doi and title in title_cache:
+            cf_title, cf_year = title_cache[title]
+            if cf_title:
+                title = cf_title
+            if cf_year:
+                year = cf_year
+
+        if not year and year_guess:
+            year = year_guess
+
+        item = PreviewItem(
+            pdf=pdf,
+            old_name=pdf.name,
+            new_path=None,
+            doi=doi,
+            title=title,
+            year=year,
+            status="pending",
+            reason="pending",
+            apply=False,
+        )
+        place_item(item)
+        items.append(item)
+        if item_cb:
+            item_cb(idx, total, item)
 
     return items
 
 
+@functools.lru_cache(maxsize=None)
+def _renameat2():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):  # glibc < 2.28 or non-glibc libc
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+def rename_noreplace(src: Path, dst: Path) -> None:
+    fn = _renameat2()
+    if fn is not None:
+        if fn(AT_FDCWD, os.fsencode(src), AT_FDCWD, os.fsencode(dst), RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err == errno.EEXIST:
+            raise FileExistsError(err, os.strerror(err), str(dst))
+        if err not in (errno.ENOSYS, errno.EINVAL):  # EINVAL: filesystem lacks RENAME_NOREPLACE
+            raise OSError(err, os.strerror(err), str(src))
+    if os.name != "nt" and os.path.lexists(dst):  # os.rename never overwrites on Windows
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+    os.rename(src, dst)
+
+
 def apply_changes(
     items: List[PreviewItem],
     dry_run: bool,
@@ -307,9 +1160,11 @@ def apply_changes(
     progress_cb: Optional[Callable[[int, int, PreviewItem], None]] = None,
     cancel_event: Optional[threading.Event] = None,
 ) -> Tuple[int, int]:
+    close_pdf_pool()
     renamed = 0
     skipped = 0
     total = len(items)
+    dir_devs: Dict[Path, int] = {}
     for idx, item in enumerate(items, 1):
         if cancel_event and cancel_event.is_set():
             break
@@ -324,11 +1179,25 @@ def apply_changes(
             renamed += 1
             continue
         try:
-            item.new_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_dir = item.new_path.parent
+            if dest_dir not in dir_devs:
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                dir_devs[dest_dir] = dest_dir.stat().st_dev
             target = item.new_path
-            if target.exists():
+            if item.pdf.stat().st_dev == dir_devs[dest_dir]:
+                for attempt in range(RENAME_ATTEMPTS):
+                    try:
+                        rename_noreplace(item.pdf, target)
+                        break
+                    except FileExistsError:
+                        if attempt == RENAME_ATTEMPTS - 1:
+                            raise
+                        target = unique_path(item.new_path)
+            else:
+                if log:
+                    log(f"[WARN] {item.pdf.name}: destination is on another device, copying instead of renaming")
                 target = unique_path(target)
-            item.pdf.rename(target)
+                shutil.move(str(item.pdf), str(target))
             if log:
                 log(f"[OK] {item.pdf.name} -> {target.name}")
             renamed += 1
@@ -339,6 +1208,13 @@ def apply_changes(
     return renamed, skipped
 
 
+def make_progress(total: int, desc: str):
+    tqdm = optional_import("tqdm")
+    if tqdm is None or total == 0 or not sys.stderr.isatty():
+        return None
+    return tqdm.tqdm(total=total, desc=desc, unit="pdf", smoothing=0.05, leave=False)
+
+
 def run_cli(args) -> None:
     folder = Path(args.folder).expanduser().resolve()
     if not folder.exists() or not folder.is_dir():
@@ -347,7 +1223,8 @@ def run_cli(args) -> None:
     pdfs = collect_pdfs(folder, args.recursive)
     print(f"Found {len(pdfs)} PDFs in {folder} (recursive={args.recursive})")
 
-    user_agent = "PDF-Renamer/1.0 (mailto:unknown@example.com)"
+    user_agent = build_user_agent(args.mailto)
+    bar = make_progress(len(pdfs), "Scanning")
     items = compute_preview(
         folder=folder,
         pdfs=pdfs,
@@ -359,33 +1236,56 @@ def run_cli(args) -> None:
         timeout=args.timeout,
         unmatched_dir=args.unmatched_dir,
         user_agent=user_agent,
+        progress_cb=(lambda i, t, p: bar.update()) if bar else None,
+        workers=args.workers,
+        processes=args.executor == "process",
+        skip_named=args.skip_already_named,
+        no_text=args.no_text,
+        use_cache=not args.no_cache,
     )
+    if bar:
+        bar.close()
 
+    lines: List[str] = []
     for idx, item in enumerate(items, 1):
-        print(f"\n[{idx}/{len(items)}] {item.old_name}")
+        lines.append(f"\n[{idx}/{len(items)}] {item.old_name}")
         if item.status == "skip":
-            print("  [SKIP] no title found.")
-            continue
-        if item.status == "ok":
-            print("  [OK] already good name.")
-            continue
-        if args.dry_run:
-            print(f"  [DRY] {item.old_name} -> {item.new_path.name}")
+            lines.append("  [SKIP] no title found.")
+        elif item.status == "ok":
+            lines.append("  [OK] already good name.")
+        elif args.dry_run:
+            lines.append(f"  [DRY] {item.old_name} -> {item.new_path.name}")
+        else:
+            lines.append(f"  [DO] {item.old_name} -> {item.new_path.name}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def log_problem(line: str) -> None:
+        if not line.startswith(("[WARN]", "[FAIL]")):
+            return
+        tqdm = optional_import("tqdm")
+        if tqdm is not None:
+            tqdm.tqdm.write(line, file=sys.stderr)
         else:
-            print(f"  [DO] {item.old_name} -> {item.new_path.name}")
+            print(line, file=sys.stderr)
 
-    renamed, skipped = apply_changes(items, args.dry_run)
+    bar = None if args.dry_run else make_progress(len(items), "Renaming")
+    renamed, skipped = apply_changes(
+        items, args.dry_run, log=log_problem, progress_cb=(lambda i, t, it: bar.update()) if bar else None
+    )
+    if bar:
+        bar.close()
     print("\nDone.")
     print(f"Renamed: {renamed}")
     print(f"Skipped: {skipped}")
+    print(f"Already named: {sum(1 for item in items if item.status == 'ok')}")
 
 
 class RenamerGUI:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: "tk.Tk"):
         self.root = root
         self.root.title("PDF重命名工具")
         self.items: List[PreviewItem] = []
-        self.user_agent = "PDF-Renamer/1.0 (mailto:unknown@example.com)"
         self._queue: "queue.Queue[tuple]" = queue.Queue()
         self._worker: Optional[threading.Thread] = None
         self._cancel_event = threading.Event()
@@ -393,10 +1293,13 @@ class RenamerGUI:
         self.var_folder = tk.StringVar()
         self.var_recursive = tk.BooleanVar(value=False)
         self.var_no_crossref = tk.BooleanVar(value=False)
+        self.var_skip_named = tk.BooleanVar(value=False)
+        self.var_no_text = tk.BooleanVar(value=False)
         self.var_pages = tk.StringVar(value="2")
         self.var_maxlen = tk.StringVar(value="140")
         self.var_style = tk.StringVar(value="prefix")
         self.var_unmatched = tk.StringVar(value="")
+        self.var_mailto = tk.StringVar(value="")
         self.var_status = tk.StringVar(value="就绪")
 
         self._build_ui()
@@ -426,6 +1329,12 @@ class RenamerGUI:
         ttk.Checkbutton(path_frame, text="不使用Crossref(不联网)", variable=self.var_no_crossref).grid(
             row=1, column=1, sticky="w", pady=(0, 6)
         )
+        ttk.Checkbutton(path_frame, text="跳过已命名", variable=self.var_skip_named).grid(
+            row=1, column=2, sticky="w", padx=6, pady=(0, 6)
+        )
+        ttk.Checkbutton(path_frame, text="仅使用元数据", variable=self.var_no_text).grid(
+            row=2, column=0, sticky="w", padx=(8, 6), pady=(0, 6)
+        )
 
         row += 1
         options = ttk.LabelFrame(frm, text="参数")
@@ -447,6 +1356,8 @@ class RenamerGUI:
         ttk.Radiobutton(options, text="后缀(标题-年)", variable=self.var_style, value="suffix").grid(
             row=1, column=2, sticky="w", pady=(0, 6)
         )
+        ttk.Label(options, text="Crossref邮箱").grid(row=1, column=4, sticky="w", padx=(12, 6), pady=(0, 6))
+        ttk.Entry(options, textvariable=self.var_mailto, width=18).grid(row=1, column=5, sticky="w", pady=(0, 6))
 
         row += 1
         btns = ttk.Frame(frm)
@@ -536,9 +1447,12 @@ class RenamerGUI:
         self.btn_cancel.configure(state="normal" if busy else "disabled")
 
     def _poll_queue(self) -> None:
+        updates: Dict[int, PreviewItem] = {}
+        handled = False
         try:
             while True:
                 msg = self._queue.get_nowait()
+                handled = True
                 kind = msg[0]
                 if kind == "progress":
                     _, idx, total, name = msg
@@ -550,6 +1464,7 @@ class RenamerGUI:
                     self._log(text)
                 elif kind == "done_preview":
                     _, items = msg
+                    updates.clear()
                     self.items = items
                     self._refresh_tree()
                     self.var_status.set("预览完成")
@@ -559,11 +1474,9 @@ class RenamerGUI:
                     self.var_status.set("已取消预览")
                     self._set_busy(False)
                     self._worker = None
-                elif kind == "item":
-                    _, idx, item = msg
-                    if 0 <= idx < len(self.items):
-                        self.items[idx] = item
-                        self._refresh_row(idx)
+                elif kind == "items":
+                    _, batch = msg
+                    updates.update(batch)
                 elif kind == "done_rename":
                     _, renamed, skipped = msg
                     self._log(f"完成。重命名: {renamed}, 跳过: {skipped}")
@@ -587,8 +1500,13 @@ class RenamerGUI:
         except queue.Empty:
             pass
 
+        for idx, item in updates.items():
+            if 0 <= idx < len(self.items):
+                self.items[idx] = item
+                self._refresh_row(idx)
+
         if self._worker and self._worker.is_alive():
-            self.root.after(100, self._poll_queue)
+            self.root.after(50 if handled else 100, self._poll_queue)
 
     def _browse(self) -> None:
         if not filedialog:
@@ -632,6 +1550,19 @@ class RenamerGUI:
         self.items = self._pending_items(pdfs)
         self._refresh_tree()
         self._set_busy(True)
+        user_agent = build_user_agent(self.var_mailto.get().strip())
+
+        pending: List[Tuple[int, PreviewItem]] = []
+
+        def flush_items() -> None:
+            if pending:
+                self._queue.put(("items", list(pending)))
+                pending.clear()
+
+        def on_item(idx: int, total: int, item: PreviewItem) -> None:
+            pending.append((idx - 1, item))
+            if len(pending) >= GUI_ITEM_BATCH:
+                flush_items()
 
         def worker():
             try:
@@ -642,14 +1573,17 @@ class RenamerGUI:
                     maxlen=maxlen,
                     style=self.var_style.get(),
                     no_crossref=self.var_no_crossref.get(),
-                    sleep=0.2,
+                    skip_named=self.var_skip_named.get(),
+                    no_text=self.var_no_text.get(),
+                    sleep=0.0,
                     timeout=20,
                     unmatched_dir=self.var_unmatched.get().strip(),
-                    user_agent=self.user_agent,
+                    user_agent=user_agent,
                     progress_cb=lambda i, t, p: self._queue.put(("progress", i, t, p.name)),
-                    item_cb=lambda i, t, it: self._queue.put(("item", i - 1, it)),
+                    item_cb=on_item,
                     cancel_event=self._cancel_event,
                 )
+                flush_items()
                 if self._cancel_event.is_set():
                     self._queue.put(("cancelled_preview",))
                 else:
@@ -691,7 +1625,7 @@ class RenamerGUI:
         ]
 
     def _refresh_row(self, idx: int) -> None:
-        if str(idx) not in self.tree.get_children():
+        if not self.tree.exists(str(idx)):
             return
         item = self.items[idx]
         apply_text = "是" if item.apply else "否"
@@ -819,7 +1753,7 @@ class RenamerGUI:
 
 
 def run_gui() -> None:
-    if tk is None:
+    if not load_tk():
         raise SystemExit("tkinter not available.")
     root = tk.Tk()
     RenamerGUI(root)
@@ -836,11 +1770,22 @@ def main() -> None:
     ap.add_argument("--dry-run", action="store_true", help="只打印不改名（强烈建议先用）")
     ap.add_argument("--pages", type=int, default=2, help="读前几页找 DOI/年份（默认2页）")
     ap.add_argument("--maxlen", type=int, default=140, help="文件名最大长度（含 .pdf，默认140）")
-    ap.add_argument("--sleep", type=float, default=0.2, help="每次查 Crossref 间隔秒数（默认0.2）")
+    ap.add_argument("--sleep", type=float, default=0.0,
+                    help="查 Crossref 的最小间隔秒数（默认0=按 Crossref 限速头自动调整）")
     ap.add_argument("--timeout", type=int, default=20, help="Crossref 请求超时秒数（默认20）")
     ap.add_argument("--style", choices=["prefix", "suffix"], default="prefix",
                     help="年份位置：prefix=年份在前(默认)，suffix=年份在后")
     ap.add_argument("--no-crossref", action="store_true", help="不联网查 Crossref（只用PDF元数据/页面文本猜）")
+    ap.add_argument("--no-cache", action="store_true", help="不读写 Crossref 本地缓存，强制重新联网查询")
+    ap.add_argument("--mailto", default="", help="Crossref 礼貌池联系邮箱（写入 User-Agent，可提高限速额度）")
+    ap.add_argument("--workers", "--threads", dest="workers", type=int, default=None,
+                    help="并行解析PDF的 worker 数（默认=CPU核数）")
+    ap.add_argument("--executor", choices=["process", "thread"], default="process",
+                    help="解析PDF用多进程(默认)还是多线程")
+    ap.add_argument("--no-text", action="store_true",
+                    help="不读取正文，只用PDF元数据和文件名找标题/DOI/年份（最快）")
+    ap.add_argument("--skip-already-named", action="store_true",
+                    help="文件名已符合目标格式（如 2019 - 标题）的PDF直接跳过，不解析")
     ap.add_argument("--unmatched-dir", default="", help="找不到标题/年份的PDF移动到子目录名（例如: _unmatched），默认不移动")
     args = ap.parse_args()
 
@@ -851,4 +1796,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import rename_pdfs_title_year as renamer  # noqa: E402
+
+
+def find_doi(text):
+    m = renamer.DOI_RE.search(text)
+    return m.group(1) if m else None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("doi:10.1016/j.cell.2019.01.001.", "10.1016/j.cell.2019.01.001"),
+        ("10.1000/xyz123, 2019", "10.1000/xyz123"),
+        ("refs 10.1000/xyz123; 10.1000/abc", "10.1000/xyz123"),
+        ("(see 10.1000/xyz123)", "10.1000/xyz123"),
+        ("(see 10.1000/xyz123).", "10.1000/xyz123"),
+        ("10.1000/xyz123", "10.1000/xyz123"),
+    ],
+)
+def test_trailing_punctuation_is_dropped(text, expected):
+    assert find_doi(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "10.1016/S0140-6736(20)30183-5",
+        "doi: 10.1016/S0140-6736(20)30183-5.",
+        "(10.1016/S0140-6736(20)30183-5)",
+    ],
+)
+def test_inner_parentheses_are_kept(text):
+    assert find_doi(text) == "10.1016/S0140-6736(20)30183-5"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "https://doi.org/10.1000/xyz123?utm_source=x",
+        "https://example.org/doi/10.1000/xyz123?download=true&x=1",
+    ],
+)
+def test_query_string_is_not_part_of_doi(text):
+    assert find_doi(text) == "10.1000/xyz123"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "DOI：10.1000/xyz123。",
+        "10.1000/xyz123的研究",
+        "见10.1000/xyz123，第3页",
+    ],
+)
+def test_doi_stops_at_cjk_text(text):
+    assert find_doi(text) == "10.1000/xyz123"
+
+
+def test_doi_and_year_from_text():
+    assert renamer.extract_doi_and_year("Published 2019. doi:10.1016/j.cell.2019.01.001.") == (
+        "10.1016/j.cell.2019.01.001",
+        2019,
+    )
+    assert renamer.extract_doi_and_year("dose 10.5 mg in 2012") == (None, 2012)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("10.1000_xyz123.pdf", "10.1000/xyz123"),
+        ("10.1000%2Fxyz123.pdf", "10.1000/xyz123"),
+        ("paper 10.1016_S0140-6736(20)30183-5.pdf", "10.1016/S0140-6736(20)30183-5"),
+        ("smith 2019 deep learning.pdf", None),
+    ],
+)
+def test_doi_from_filename(name, expected):
+    assert renamer.doi_from_filename(Path(name)) == expected
+
+
+@pytest.mark.parametrize("tail", ["." * 20000 + "1", "." * 20000, ";)" * 10000 + " x"])
+def test_long_punctuation_runs_stay_linear(tail):
+    start = time.perf_counter()
+    doi, _ = renamer.extract_doi_and_year("10.1000/a" + tail)
+    assert time.perf_counter() - start < 0.1
+    assert doi.startswith("10.1000/a")
+
+
+def test_scan_texts_on_long_documents():
+    pages = ["Results from 2012 and 10.5 mg doses. " * 100] * 30
+    assert renamer.scan_texts(pages, True) == (None, 2012)
+    pages[-1] += " doi:10.1000/xyz123. 2019"
+    assert renamer.scan_texts(pages, True) == ("10.1000/xyz123", 2019)
@@ -0,0 +1,56 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import rename_pdfs_title_year as renamer  # noqa: E402
+
+
+def rename_item(src, dst):
+    return renamer.PreviewItem(
+        pdf=src,
+        old_name=src.name,
+        new_path=dst,
+        doi=None,
+        title="Title",
+        year=2019,
+        status="rename",
+        reason="ready",
+        apply=True,
+    )
+
+
+def make_target(tmp_path, kind):
+    target = tmp_path / "2019 - Title.pdf"
+    if kind == "file":
+        target.write_bytes(b"existing")
+    else:
+        try:
+            os.symlink(tmp_path / "missing.pdf", target)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not available")
+    return target
+
+
+@pytest.mark.parametrize("renameat2", [True, False], ids=["renameat2", "fallback"])
+@pytest.mark.parametrize("kind", ["file", "dangling symlink"])
+def test_rename_onto_taken_name_picks_numbered_name(tmp_path, monkeypatch, kind, renameat2):
+    if not renameat2:
+        monkeypatch.setattr(renamer, "_renameat2", lambda: None)
+    target = make_target(tmp_path, kind)
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"new")
+    logs = []
+
+    assert renamer.apply_changes([rename_item(src, target)], dry_run=False, log=logs.append) == (1, 0)
+
+    assert not src.exists()
+    assert (tmp_path / "2019 - Title (2).pdf").read_bytes() == b"new"
+    if kind == "file":
+        assert target.read_bytes() == b"existing"
+    else:
+        assert target.is_symlink() and not target.exists()
+    assert logs == ["[OK] a.pdf -> 2019 - Title (2).pdf"]